@@ -41,7 +41,7 @@ from adafruit_motor import servo
 from digitalio import DigitalInOut
 from micropython import const
 
-from grove_vision_ai_v2 import CMD_OK, ATDevice, Box
+from grove_vision_ai_v2 import CMD_OK, ATDevice
 
 # Configuration
 # Scaling (pixels to degrees)
@@ -78,6 +78,7 @@ class Smoother:
             raise ValueError("Alpha must be between 0.0 and 1.0")
         self.value = initial_value
         self.alpha = alpha
+        self._one_minus_alpha = 1.0 - alpha
 
     def update(self, new_value: float) -> float:
         """Update the smoothed value with a new input.
@@ -88,68 +89,36 @@ class Smoother:
         Returns:
             The newly smoothed value.
         """
-        self.value = self.alpha * new_value + (1.0 - self.alpha) * self.value
+        self.value = self.alpha * new_value + self._one_minus_alpha * self.value
         return self.value
 
 
-smoothed_angle = Smoother(90, SMOOTH_ALPHA)
-
-
-def enable_led(value: bool) -> None:
-    """Enable or disable the indicator LED.
-
-    Args:
-        value: True to turn LED on, False to turn off.
-            Note: LED logic is inverted (low = on).
-    """
-    led.value = not bool(value)
-
-
-def set_motor(target_angle: float | None) -> None:
-    """Set the servo motor angle with exponential smoothing.
-
-    Args:
-        target_angle: Desired servo angle in degrees (0-180), or None to skip update.
-    """
-    if target_angle is not None:
-        motor.angle = smoothed_angle.update(target_angle)
-
-
-def centroid_to_angle(x: int) -> float:
-    """Convert image x-coordinate to servo angle.
-
-    Maps camera x-coordinate (0-240 pixels) to servo angle (0-180 degrees).
-    The center of the image (120 pixels) maps to 90 degrees (servo center).
-
-    Args:
-        x: X-coordinate in pixels (0-240).
-
-    Returns:
-        Servo angle in degrees (0-180).
-    """
-    return 90 + (x - HALF_IMAGE_WIDTH) * PIXEL_SCALE
-
-
-def get_best_box_angle(boxes: list[Box]) -> float | None:
+def get_best_box_angle(count: int, xs, ws) -> float | None:
     """Select the best detection box and convert to servo angle.
 
     Chooses the widest detection box (assumed to be the nearest person)
     and returns the servo angle to center on it.
+    The center of the image (120 pixels) maps to 90 degrees (servo center).
 
     Args:
-        boxes: List of Box objects from AI inference.
+        count: Number of boxes from AI inference.
+        xs: Box center x-coordinates (ATDevice.box_xs).
+        ws: Box widths (ATDevice.box_ws).
 
     Returns:
         Servo angle in degrees, or None if no boxes detected.
     """
-    if not boxes or len(boxes) == 0:
+    if not count:
         return None
-    # Choose the box with the best score
-    # boxes_sorted = sorted(boxes, key=lambda x: x.score, reverse=True)
     # Choose the widest box (nearest person)
-    boxes_sorted = sorted(boxes, key=lambda x: x.w, reverse=True)
+    best = 0
+    best_w = ws[0]
+    for i in range(1, count):
+        if ws[i] > best_w:
+            best = i
+            best_w = ws[i]
     # Translate from x values 0-240 to angle values 180-0
-    return centroid_to_angle(boxes_sorted[0].x)
+    return 90 + (xs[best] - HALF_IMAGE_WIDTH) * PIXEL_SCALE
 
 
 # Turn on debug to watch communications
@@ -160,34 +129,51 @@ def get_best_box_angle(boxes: list[Box]) -> float | None:
 # print(f"name={ai.name()}")
 
 
-def run():
-    led.switch_to_output(value=True)
-    target_angle = motor.angle = 90
+def run(device: ATDevice, pan_servo: servo.Servo, indicator: DigitalInOut) -> None:
+    """Follow the nearest person until interrupted.
+
+    Args:
+        device: The Grove Vision AI V2 device.
+        pan_servo: The pan servo.
+        indicator: The indicator LED (active low).
+    """
+    # Bind everything used per frame to locals to avoid global lookups.
+    # The result list and arrays are reused by the ATDevice, so bind them once too.
+    mono = now
+    invoke = device.invoke
+    best_box_angle = get_best_box_angle
+    smooth = Smoother(90, SMOOTH_ALPHA).update
+    boxes = device.boxes
+    xs = device.box_xs
+    ws = device.box_ws
+
+    indicator.switch_to_output(value=True)
+    target_angle = pan_servo.angle = 90
 
     while True:
         try:
-            started = now()
-            err = ai.invoke(1, True, True)
-            duration = int((now() - started) * 1000)
+            started = mono()
+            err = invoke(1, True, True)
+            duration = int((mono() - started) * 1000)
             if err != CMD_OK:
-                enable_led(False)
+                indicator.value = True  # off
                 print(f"{duration} No response")
             else:
-                best_angle = get_best_box_angle(ai.boxes)
+                best_angle = best_box_angle(len(boxes), xs, ws)
                 if best_angle is not None:
-                    enable_led(True)
+                    indicator.value = False  # on
                     target_angle = best_angle
-                    print(f"{duration} Boxes: {ai.boxes}, Perf: {ai.perf}")
+                    print(f"{duration} Boxes: {boxes}, Perf: {device.perf}")
                 else:
-                    enable_led(False)
+                    indicator.value = True  # off
                     print(f"{duration} No boxes")
         except ValueError as e:
             print(e)
         except KeyboardInterrupt:
-            target_angle = motor.angle = 90
+            pan_servo.angle = 90
             break
 
-        set_motor(target_angle)
+        pan_servo.angle = smooth(target_angle)
 
 
-run()
+run(ai, motor, led)
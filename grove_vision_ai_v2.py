@@ -54,11 +54,15 @@ import binascii
 import gc
 import json
 import time
+from array import array
 
 import busio
 from micropython import const
 
 now = time.monotonic
+# Cached to skip the module attribute lookup on each response
+_loads = json.loads
+_a2b_base64 = binascii.a2b_base64
 
 # AT commands from the Arduino library
 # Tested
@@ -104,6 +108,35 @@ CMD_ENOTSUP = 8
 CMD_EPERM = 9
 CMD_EUNKNOWN = 10
 
+# Wire form of the commands that take no arguments, built once at import
+_COMMAND_WIRE = {
+    cmd: f"AT+{cmd}\r\n".encode()
+    for cmd in (
+        CMD_AT_ACTION_STATUS,
+        CMD_AT_ALGOS,
+        CMD_AT_BREAK,
+        CMD_AT_ID,
+        CMD_AT_INFO,
+        CMD_AT_MODELS,
+        CMD_AT_MODEL_STATUS,
+        CMD_AT_NAME,
+        CMD_AT_RESET,
+        CMD_AT_SAMPLE_STATUS,
+        CMD_AT_SENSORS,
+        CMD_AT_SENSOR_STATUS,
+        CMD_AT_STATUS,
+        CMD_AT_VERSION,
+    )
+}
+
+# Wire form of INVOKE commands, keyed by (times, diffonly, resultonly).
+# Seeded with invoke(1, True, True), the usual per-frame command.
+_INVOKE_WIRE_CACHE = {(1, True, True): b"AT+INVOKE=1,1,1\r\n"}
+_INVOKE_WIRE_CACHE_SIZE = const(8)
+
+# Commands whose events carry inference results or images
+_EVENT_NAMES = {CMD_AT_INVOKE, CMD_AT_SAMPLE}
+
 RESPONSE_PREFIX = const(b"\r{")
 RESPONSE_SUFFIX = const(b"}\n")
 
@@ -126,6 +159,56 @@ class DecodeError(ValueError):
     pass
 
 
+def _recycle(pool: list, results: list, rows: list, factory) -> None:
+    """Refill ``results`` from ``rows``, reusing the result objects kept in ``pool``.
+
+    ``results`` is always a prefix of ``pool``, so new objects are only allocated
+    when more rows arrive than have ever been seen before.
+    """
+    del results[len(rows) :]
+    for i, row in enumerate(rows):
+        if i < len(pool):
+            pool[i].update(*row)
+        else:
+            pool.append(factory(*row))
+        if i == len(results):
+            results.append(pool[i])
+
+
+def _peek_field(response: bytes, key: bytes, end: int) -> str | None:
+    """Return the raw text of the scalar field ``key`` in ``response[:end]``, or None."""
+    if (start := response.find(key, 0, end)) == -1:
+        return None
+    start += len(key)
+    if (stop := response.find(b",", start, end)) == -1:
+        return None
+    return str(response[start:stop], "utf-8").strip()
+
+
+def _peek_header(response: bytes) -> tuple[int, str, int] | None:
+    """Read the type, name and code of a response without a full JSON parse.
+
+    The device sends these fields before ``"data"``, so only that part of the
+    response is searched.
+
+    Returns:
+        A ``(type, name, code)`` tuple, or None if the response doesn't have the
+        expected shape (the caller should then fall back to ``json.loads``).
+    """
+    end = response.find(b'"data":')
+    if end == -1:
+        end = len(response)
+    rtype = _peek_field(response, b'"type":', end)
+    name = _peek_field(response, b'"name":', end)
+    code = _peek_field(response, b'"code":', end)
+    if rtype is None or name is None or code is None or len(name) < 2 or name[0] != '"':
+        return None
+    try:
+        return int(rtype), name[1:-1], int(code)
+    except ValueError:
+        return None
+
+
 class Perf:
     """Performance metrics from model inference.
 
@@ -135,7 +218,13 @@ class Perf:
         postprocess: Postprocessing time in milliseconds.
     """
 
+    __slots__ = ("preprocess", "inference", "postprocess")
+
     def __init__(self, preprocess: int = 0, inference: int = 0, postprocess: int = 0) -> None:
+        self.update(preprocess, inference, postprocess)
+
+    def update(self, preprocess: int = 0, inference: int = 0, postprocess: int = 0) -> None:
+        """Replace the metrics in place."""
         self.preprocess = preprocess
         self.inference = inference
         self.postprocess = postprocess
@@ -158,9 +247,17 @@ class Box:
         target: Target class index.
     """
 
+    __slots__ = ("x", "y", "w", "h", "score", "target")
+
     def __init__(  # noqa: PLR0913, PLR0917
         self, x: int, y: int, w: int, h: int, score: int, target: int
     ) -> None:
+        self.update(x, y, w, h, score, target)
+
+    def update(  # noqa: PLR0913, PLR0917
+        self, x: int, y: int, w: int, h: int, score: int, target: int
+    ) -> None:
+        """Replace the box coordinates, score and target in place."""
         self.x = x
         self.y = y
         self.w = w
@@ -200,7 +297,13 @@ class Class:
         target: Target class index.
     """
 
+    __slots__ = ("score", "target")
+
     def __init__(self, score: int, target: int) -> None:
+        self.update(score, target)
+
+    def update(self, score: int, target: int) -> None:
+        """Replace the score and target in place."""
         self.score = score
         self.target = target
 
@@ -218,7 +321,13 @@ class Point:
         target: Target point index.
     """
 
+    __slots__ = ("x", "y", "score", "target")
+
     def __init__(self, x: int, y: int, score: int, target: int) -> None:
+        self.update(x, y, score, target)
+
+    def update(self, x: int, y: int, score: int, target: int) -> None:
+        """Replace the point coordinates, score and target in place."""
         self.x = x
         self.y = y
         self.score = score
@@ -238,9 +347,22 @@ class Keypoint:
         points: List of Point objects representing keypoints/landmarks.
     """
 
+    __slots__ = ("box", "points", "_point_pool")
+
     def __init__(self, box: Box, points: list[Point]) -> None:
         self.box = box
         self.points = points
+        self._point_pool = list(points)
+
+    @classmethod
+    def from_row(cls, box: list, points: list) -> Keypoint:
+        """Create a Keypoint from the raw ``[box, [point, ...]]`` lists in an event."""
+        return cls(Box(*box), [Point(*point) for point in points])
+
+    def update(self, box: list, points: list) -> None:
+        """Replace the box and points in place from the raw lists in an event."""
+        self.box.update(*box)
+        _recycle(self._point_pool, self.points, points, Point)
 
     def __repr__(self) -> str:
         return f"Keypoint(box={repr(self.box)}, points={repr(self.points)})"
@@ -249,17 +371,27 @@ class Keypoint:
 class Image:
     """JPEG image data decoded from base64.
 
-    Attributes:
-        data: Raw JPEG image bytes.
+    The base64 text is only decoded the first time `data` is read.
     """
 
+    __slots__ = ("_b64", "_data")
+
     def __init__(self, base64: str) -> None:
         """Initialize Image from base64-encoded string.
 
         Args:
             base64: Base64-encoded JPEG image data from the AI board.
         """
-        self.data: bytes = binascii.a2b_base64(base64)
+        self._b64 = base64
+        self._data = None
+
+    @property
+    def data(self) -> bytes:
+        """Raw JPEG image bytes."""
+        if self._data is None:
+            self._data = _a2b_base64(self._b64)
+            self._b64 = None
+        return self._data
 
 
 class ATDevice:  # noqa: PLR0904
@@ -289,7 +421,9 @@ class ATDevice:  # noqa: PLR0904
             uart_bufsize: Size of UART receiver buffer in bytes. Default 1024.
                           Increase if bytes are being lost.
             bufsize: Size of response buffer in bytes for JSON parsing. Default 1024.
-                     Increase if responses are being truncated.
+                     Increase if responses are being truncated. The buffer is
+                     allocated once, here, so pass the largest size you will need
+                     (for instance, enough for events carrying images).
 
         Note:
             Even with adequate buffer sizes,
@@ -308,17 +442,31 @@ class ATDevice:  # noqa: PLR0904
         self.uart = uart
         uart.reset_input_buffer()
         gc.collect()
+        # Warm up the json module here, so the first inference doesn't pay for it
+        json.dumps(None)
         self._response_buffer = bytearray(bufsize)
         self._mv = memoryview(self._response_buffer)
         self._response = None
-        self._remaining_bytes = None
+        self._start_index = 0
         self._debug = False
         self._perf = Perf()
+        # Result objects are reused from these pools on every event
         self._boxes = []
+        self._box_pool = []
+        # Box geometry packed into int16 columns, for fast scans over all boxes
+        self._box_xs = array("h")
+        self._box_ys = array("h")
+        self._box_ws = array("h")
+        self._box_hs = array("h")
         self._classes = []
+        self._class_pool = []
         self._keypoints = []
+        self._keypoint_pool = []
         self._points = []
+        self._point_pool = []
         self._image = None
+        # False after invoke(..., resultonly=True): skip any image in the event
+        self._want_image = True
         self._id = None
         self._name = None
         self._info = None
@@ -328,17 +476,22 @@ class ATDevice:  # noqa: PLR0904
     @property
     def response_bufsize(self) -> int:
         """Size of the response buffer in bytes.
-        Setting this to a new value re-allocates the buffer
-        and does a GC collection."""
-        return len(self._response_buffer)
+
+        The buffer is allocated once, with the ``bufsize`` passed to the
+        constructor, so that a large allocation never has to be made on a
+        fragmented heap later. This can be set to limit the usable size, but
+        not to more than ``bufsize``."""
+        return len(self._mv)
 
     @response_bufsize.setter
     def response_bufsize(self, value: int) -> None:
-        self._response_buffer = None  # type: ignore
-        self._mv = None  # type: ignore
-        gc.collect()
-        self._response_buffer = bytearray(value)
-        self._mv = memoryview(self._response_buffer)
+        if not 0 < value <= len(self._response_buffer):
+            raise ValueError(
+                f"response_bufsize must be between 1 and {len(self._response_buffer)}; "
+                + "pass a larger bufsize to ATDevice()"
+            )
+        self._mv = memoryview(self._response_buffer)[:value]
+        self._start_index = 0
 
     @property
     def response(self) -> dict | None:
@@ -356,27 +509,66 @@ class ATDevice:  # noqa: PLR0904
 
     @property
     def perf(self) -> Perf:
-        """Performance metrics from last inference (Perf object)."""
+        """Performance metrics from last inference (Perf object).
+
+        The same object is updated in place by each inference."""
         return self._perf
 
     @property
     def boxes(self) -> list[Box]:
-        """List of Box objects from last detection inference."""
+        """List of Box objects from last detection inference.
+
+        The list and the objects in it are reused by the next inference,
+        so copy any values that you need to keep."""
         return self._boxes
 
+    @property
+    def box_xs(self) -> array:
+        """Array of box center x-coordinates from last detection inference.
+
+        Only the first ``len(boxes)`` entries are valid; the array is reused."""
+        return self._box_xs
+
+    @property
+    def box_ys(self) -> array:
+        """Array of box center y-coordinates from last detection inference.
+
+        Only the first ``len(boxes)`` entries are valid; the array is reused."""
+        return self._box_ys
+
+    @property
+    def box_ws(self) -> array:
+        """Array of box widths from last detection inference.
+
+        Only the first ``len(boxes)`` entries are valid; the array is reused."""
+        return self._box_ws
+
+    @property
+    def box_hs(self) -> array:
+        """Array of box heights from last detection inference.
+
+        Only the first ``len(boxes)`` entries are valid; the array is reused."""
+        return self._box_hs
+
     @property
     def classes(self) -> list[Class]:
-        """List of Class objects from last classification inference."""
+        """List of Class objects from last classification inference.
+
+        The list and the objects in it are reused by the next inference."""
         return self._classes
 
     @property
     def keypoints(self) -> list[Keypoint]:
-        """List of Keypoint objects from last keypoint inference."""
+        """List of Keypoint objects from last keypoint inference.
+
+        The list and the objects in it are reused by the next inference."""
         return self._keypoints
 
     @property
     def points(self) -> list[Point]:
-        """List of Point objects from last point inference."""
+        """List of Point objects from last point inference.
+
+        The list and the objects in it are reused by the next inference."""
         return self._points
 
     @property
@@ -386,116 +578,195 @@ class ATDevice:  # noqa: PLR0904
 
     def _send_command(self, command: str, tag: str | None = None) -> None:
         if tag:
-            full_command = f"AT+{tag}@{command}\r\n"
-        else:
-            full_command = f"AT+{command}\r\n"
-        if self.debug:
-            print(f"=> {full_command}")
-        full_command_bytes = full_command.encode("utf-8")
-        self._last_full_command = full_command_bytes
-        self.uart.write(full_command_bytes)
+            full_command = f"AT+{tag}@{command}\r\n".encode()
+        elif (full_command := _COMMAND_WIRE.get(command)) is None:
+            full_command = f"AT+{command}\r\n".encode()
+        self._write_command(full_command)
+
+    def _write_command(self, full_command: bytes) -> None:
+        """Send an already-encoded AT command, remembering it for _retry_command()."""
+        if __debug__ and self._debug:
+            print(f"=> {str(full_command, 'utf-8')}")
+        self._last_full_command = full_command
+        self.uart.write(full_command)
 
     def _retry_command(self) -> None:
         self.uart.write(self._last_full_command)
 
-    def _fetch_response(self, timeout: float) -> str | None:
-        """Receive and return the next full JSON response as a string.
+    def _fetch_response(self, timeout: float) -> bytes | None:  # noqa: PLR0912, PLR0914, PLR0915
+        """Receive and return the next full JSON response as bytes.
 
-        Handles buffering of multiple JSON responses and caches remaining data
-        for subsequent calls.
+        Handles buffering of multiple JSON responses: any bytes after the returned
+        response are moved to the front of the buffer, and the next call scans
+        them before reading more from the UART.
 
         Args:
             timeout: Maximum time to wait for response in seconds.
 
         Returns:
-            JSON response string, or None on timeout.
+            JSON response bytes, or None on timeout.
         """
+        # With mpy-cross -O1 or higher, __debug__ is False and this is always off
+        debug = __debug__ and self._debug
+        # Bytes left at the front of the buffer by the previous call
+        index = self._start_index
+        self._start_index = 0
+        suffix_end = 0
+        if index and (where := self._response_buffer.find(RESPONSE_SUFFIX, 0, index)) != -1:
+            suffix_end = where + 2  # Position after }\n
+        scan_from = index
         t_start = now()
-        if self._remaining_bytes:
-            response = str(
-                self._mv[self._remaining_bytes[0] : self._remaining_bytes[1]], "utf-8"
-            ).strip()
-            self._remaining_bytes = None
-            if self.debug:
-                print(f"<=(CACHED) {response} [took {(now() - t_start) * 1000:.1f}ms]")
-            return response
-        end_time = now() + timeout
-        index = 0
-        first_byte_time = None
-        poll_count = 0
-        while now() < end_time:
-            poll_count += 1
-            if self.uart.in_waiting == 0:
-                continue
-            if first_byte_time is None:
-                first_byte_time = now()
-            bytes_read = self.uart.readinto(self._mv[index:])
-            index += bytes_read
-            if (where := self._response_buffer.find(RESPONSE_SUFFIX, 0, index)) != -1:
-                suffix_end = where + 2  # Position after }\n
-                response = str(self._mv[0:suffix_end], "utf-8").strip()
-                # Check if there are remaining bytes after this response
-                if suffix_end < index:
-                    self._remaining_bytes = (suffix_end, index)
-                    if self.debug:
-                        print(f"[BUFFER] Saving {index - suffix_end} remaining bytes")
-                else:
-                    self._remaining_bytes = None
-                elapsed = (now() - t_start) * 1000
-                wait_for_first = (first_byte_time - t_start) * 1000 if first_byte_time else 0
-                if self.debug:
-                    print(f"<=(NEW) {response}")
-                    print(
-                        f"[TIMING] _fetch_response: waited {wait_for_first:.1f}ms for first byte, "
-                        + f"total {elapsed:.1f}ms, {poll_count} polls, {index} bytes"
-                    )
-                return response
-        if self.debug:
-            duration = (now() - t_start) * 1000
-            print(f"[TIMEOUT] _fetch_response timed out after {duration:.1f}ms, {poll_count} polls")
-        return None
+        end_time = t_start + timeout
+        if debug:
+            first_byte_time = t_start if index else None
+            poll_count = 0
+        uart = self.uart
+        uart_timeout = uart.timeout
+        bufsize = len(self._mv)
+        try:
+            while not suffix_end:
+                # A full buffer without a suffix can't be completed; it is dropped below
+                if index == bufsize:
+                    break
+                if (waiting := uart.in_waiting) == 0:
+                    # Only look at the clock when nothing is buffered
+                    if (remaining := end_time - now()) <= 0:
+                        break
+                    # Don't let a blocking read run past the deadline
+                    if remaining < uart_timeout:
+                        uart.timeout = remaining
+                    # Ask for one byte: readinto() blocks in the UART driver for up
+                    # to uart.timeout, and returns None if nothing arrived in that time.
+                    waiting = 1
+                # Otherwise drain everything already buffered in one call
+                want = min(waiting, bufsize - index)
+                bytes_read = uart.readinto(self._mv[index : index + want])
+                if debug:
+                    poll_count += 1
+                    if bytes_read and first_byte_time is None:
+                        first_byte_time = now()
+                if not bytes_read:
+                    continue
+                index += bytes_read
+                # Only scan the new bytes, backing up one in case the suffix was split
+                where = self._response_buffer.find(RESPONSE_SUFFIX, max(0, scan_from - 1), index)
+                scan_from = index
+                if where != -1:
+                    suffix_end = where + 2  # Position after }\n
+        finally:
+            uart.timeout = uart_timeout
+
+        if not suffix_end:
+            if debug:
+                duration = (now() - t_start) * 1000
+                print(
+                    f"[TIMEOUT] _fetch_response timed out after {duration:.1f}ms, "
+                    + f"{poll_count} polls"
+                )
+            # Keep a partial response for the next call, unless it filled the buffer
+            if index < bufsize:
+                self._start_index = index
+            return None
 
-    def _parse_perf(self, data: dict) -> None:
-        """Parse performance metrics from event data."""
-        if (perf := data.get("perf", None)) and isinstance(perf, list):
-            self._perf = Perf(*perf)
+        response = self._frame(0, suffix_end)
+        # Move any bytes after this response to the front for the next call
+        if suffix_end < index:
+            self._start_index = index - suffix_end
+            self._mv[0 : self._start_index] = bytes(self._mv[suffix_end:index])
+            if debug:
+                print(f"[BUFFER] Saving {self._start_index} remaining bytes")
+        if debug:
+            elapsed = (now() - t_start) * 1000
+            wait_for_first = (first_byte_time - t_start) * 1000
+            print(f"<= {str(response, 'utf-8')}")
+            print(
+                f"[TIMING] _fetch_response: waited {wait_for_first:.1f}ms for first byte, "
+                + f"total {elapsed:.1f}ms, {poll_count} polls, {index} bytes"
+            )
+        return response
+
+    def _frame(self, start: int, suffix_end: int) -> bytes:
+        """Copy out the JSON object in the buffer that ends just before suffix_end.
+
+        The object starts after the \\r of the last RESPONSE_PREFIX (if present),
+        skipping any incomplete response before it, and ends before the \\n of
+        RESPONSE_SUFFIX, so no whitespace needs stripping.
+        """
+        if (prefix := self._response_buffer.rfind(RESPONSE_PREFIX, start, suffix_end)) != -1:
+            start = prefix + 1
+        return bytes(self._mv[start : suffix_end - 1])
+
+    def _parse_perf(self, perf) -> None:
+        """Parse the ``perf`` field of event data."""
+        if perf and isinstance(perf, list):
+            self._perf.update(*perf)
         else:
-            self._perf = Perf()
+            self._perf.update()
 
-    def _parse_boxes(self, data: dict) -> None:
-        """Parse bounding boxes from event data."""
-        if (boxes := data.get("boxes", None)) and isinstance(boxes, list):
-            self._boxes = [Box(*box) for box in boxes]
-        else:
-            self._boxes.clear()
+    def _parse_boxes(self, boxes) -> None:
+        """Parse the ``boxes`` field of event data.
 
-    def _parse_classes(self, data: dict) -> None:
-        """Parse classification results from event data."""
-        if (classes := data.get("classes", None)) and isinstance(classes, list):
-            self._classes = [Class(*cls) for cls in classes]
+        This is the per-frame hot path for detection models, so it fills the
+        pooled Box objects and the geometry arrays in one pass, indexing each
+        row explicitly instead of unpacking it with ``*``.
+        """
+        results = self._boxes
+        if not (boxes and isinstance(boxes, list)):
+            results.clear()
+            return
+        pool = self._box_pool
+        xs = self._box_xs
+        ys = self._box_ys
+        ws = self._box_ws
+        hs = self._box_hs
+        del results[len(boxes) :]
+        # The pool and the arrays always grow together, so they have the same length
+        for i, row in enumerate(boxes):
+            x = row[0]
+            y = row[1]
+            w = row[2]
+            h = row[3]
+            if i < len(pool):
+                box = pool[i]
+                box.update(x, y, w, h, row[4], row[5])
+                xs[i] = x
+                ys[i] = y
+                ws[i] = w
+                hs[i] = h
+            else:
+                box = Box(x, y, w, h, row[4], row[5])
+                pool.append(box)
+                xs.append(x)
+                ys.append(y)
+                ws.append(w)
+                hs.append(h)
+            if i == len(results):
+                results.append(box)
+
+    def _parse_classes(self, classes) -> None:
+        """Parse the ``classes`` field of event data."""
+        if classes and isinstance(classes, list):
+            _recycle(self._class_pool, self._classes, classes, Class)
         else:
             self._classes.clear()
 
-    def _parse_points(self, data: dict) -> None:
-        """Parse point detections from event data."""
-        if (points := data.get("points", None)) and isinstance(points, list):
-            self._points = [Point(*point) for point in points]
+    def _parse_points(self, points) -> None:
+        """Parse the ``points`` field of event data."""
+        if points and isinstance(points, list):
+            _recycle(self._point_pool, self._points, points, Point)
         else:
             self._points.clear()
 
-    def _parse_keypoints(self, data: dict) -> None:
-        """Parse keypoint detections from event data."""
-        self._keypoints.clear()
-        if (keypoints := data.get("keypoints", None)) and isinstance(keypoints, list):
-            self._keypoints = []
-            for kp in keypoints:
-                box = Box(*kp[0])
-                points = [Point(*point) for point in kp[1]]
-                self._keypoints.append(Keypoint(box, points))
-
-    def _parse_image(self, data: dict) -> None:
-        """Parse image data from event data."""
-        if (image := data.get("image", None)) and isinstance(image, str):
+    def _parse_keypoints(self, keypoints) -> None:
+        """Parse the ``keypoints`` field of event data."""
+        if keypoints and isinstance(keypoints, list):
+            _recycle(self._keypoint_pool, self._keypoints, keypoints, Keypoint.from_row)
+        else:
+            self._keypoints.clear()
+
+    def _parse_image(self, image) -> None:
+        """Parse the ``image`` field of event data."""
+        if image and isinstance(image, str):
             self._image = Image(image)
         else:
             self._image = None
@@ -505,23 +776,32 @@ class ATDevice:  # noqa: PLR0904
 
         Extracts inference results (boxes, classes, points, keypoints, images)
         from INVOKE and SAMPLE events and updates instance attributes.
+        SAMPLE events carry no detections, so only perf and the image are
+        read from them, and the previous inference results are kept.
 
         Args:
             response: Parsed JSON response dictionary.
         """
-        if response["name"] not in {CMD_AT_INVOKE, CMD_AT_SAMPLE}:
+        name = response["name"]
+        if name not in _EVENT_NAMES:
             return
 
         data = response.get("data", None)
         if data is None:
             return
 
-        self._parse_perf(data)
-        self._parse_boxes(data)
-        self._parse_classes(data)
-        self._parse_points(data)
-        self._parse_keypoints(data)
-        self._parse_image(data)
+        # Each field is looked up once here, through a bound get()
+        dget = data.get
+        self._parse_perf(dget("perf"))
+        if name != CMD_AT_SAMPLE:
+            self._parse_boxes(dget("boxes"))
+            self._parse_classes(dget("classes"))
+            self._parse_points(dget("points"))
+            self._parse_keypoints(dget("keypoints"))
+        if self._want_image:
+            self._parse_image(dget("image"))
+        else:
+            self._image = None
 
     def _parse_log(self, response: dict) -> None:
         """Handle a log JSON response (type=_CMD_TYPE_LOG)."""
@@ -529,40 +809,94 @@ class ATDevice:  # noqa: PLR0904
         pass
 
     def _wait(self, response_type: int, cmd: str, timeout: float = 1.0) -> int:
+        # Get the command up to the first "="
+        base_cmd = cmd if (eq := cmd.find("=")) < 0 else cmd[:eq]
         end_time = now() + timeout
-        while now() < end_time:
-            resp = self._fetch_response(timeout)
+        while (remaining := end_time - now()) > 0:
+            resp = self._fetch_response(remaining)
+            if resp is None:
+                continue
+            # Discard replies to other commands without parsing all of their JSON
+            if (header := _peek_header(resp)) is not None and header[0] != _CMD_TYPE_LOG:
+                if header[0] != response_type or header[1] != base_cmd:
+                    continue
+            response = self._response = self._parse_json(resp)
+
+            rtype: int = response["type"]
+            if rtype == response_type and response["name"] == base_cmd:
+                # Only the awaited event's results are decoded
+                if rtype == _CMD_TYPE_EVENT:
+                    self._parse_event(response)
+                return response["code"]
+            if rtype == _CMD_TYPE_LOG:
+                self._parse_log(response)
+                return response["code"]
+            # else discard this reply
+
+        return CMD_ETIMEDOUT
+
+    def _wait_response_and_event(self, cmd: str, timeout: float) -> int:
+        """Wait for both the response and the event that follow an INVOKE or SAMPLE command.
+
+        The device always sends the response before its events, so the loop
+        first waits for an OK response and then returns on the next event.
+        Any event seen before the response is a late one left over from an
+        earlier command, and is discarded.
+
+        Args:
+            cmd: The command name (CMD_AT_INVOKE or CMD_AT_SAMPLE), without arguments.
+            timeout: Maximum time to wait for the event in seconds
+                (the response is allowed an extra 50ms).
+
+        Returns:
+            The event's code, a non-OK response code, or CMD_ETIMEDOUT.
+        """
+        seen_response = False
+        end_time = now() + 0.05 + timeout
+        while (remaining := end_time - now()) > 0:
+            resp = self._fetch_response(remaining)
             if resp is None:
                 continue
+            # Discard replies to other commands, and stale events, without parsing
+            # all of their JSON
+            if (header := _peek_header(resp)) is not None and header[0] != _CMD_TYPE_LOG:
+                if header[1] != cmd or (header[0] == _CMD_TYPE_EVENT and not seen_response):
+                    continue
             response = self._response = self._parse_json(resp)
 
             retval: int = response["code"]
-            if response["type"] == _CMD_TYPE_EVENT:
-                self._parse_event(response)
-            elif response["type"] == _CMD_TYPE_LOG:
+            rtype: int = response["type"]
+            if rtype == _CMD_TYPE_LOG:
                 self._parse_log(response)
                 return retval
-
-            # Get the command up to the first "="
-            base_cmd = cmd.split("=")[0]
-            if response["type"] == response_type and response["name"] == base_cmd:
+            if response["name"] != cmd:
+                continue  # discard this reply
+            if rtype == _CMD_TYPE_EVENT:
+                if not seen_response:
+                    continue  # stale event from an earlier command
+                # The first event after an OK response is the answer
+                self._parse_event(response)
                 return retval
-            # else discard this reply
+            if retval != CMD_OK:
+                return retval
+            seen_response = True
 
         return CMD_ETIMEDOUT
 
     def _flush_serial(self) -> str:
-        resp = ""
-        while self.uart.in_waiting > 0:
-            data = self.uart.read()
+        buf = bytearray()
+        while (waiting := self.uart.in_waiting) > 0:
+            # Ask for exactly what is buffered so read() doesn't wait for its timeout
+            data = self.uart.read(waiting)
             if data:
-                resp += data.decode("utf-8")
-        return resp
+                buf.extend(data)
+        return str(buf, "utf-8")
 
     @staticmethod
-    def _parse_json(response: str) -> dict:
+    def _parse_json(response: bytes) -> dict:
+        # json.loads() takes the bytes directly; no str copy is needed
         try:
-            return json.loads(response)
+            return _loads(response)
         except ValueError as exc:
             raise DecodeError(f"Failed to decode JSON response {response}") from exc
 
@@ -585,10 +919,14 @@ class ATDevice:  # noqa: PLR0904
             ...     for box in ai.boxes:
             ...         print(f"Detected object at ({box.x}, {box.y})")
         """
-        self._send_command(f"{CMD_AT_INVOKE}={times},{int(diffonly)},{int(resultonly)}")
-        if (err := self._wait(_CMD_TYPE_RESPONSE, CMD_AT_INVOKE, 0.05)) == CMD_OK:
-            return self._wait(_CMD_TYPE_EVENT, CMD_AT_INVOKE, timeout)
-        return err
+        key = (times, diffonly, resultonly)
+        if (wire := _INVOKE_WIRE_CACHE.get(key)) is None:
+            wire = f"AT+{CMD_AT_INVOKE}={times},{int(diffonly)},{int(resultonly)}\r\n".encode()
+            if len(_INVOKE_WIRE_CACHE) < _INVOKE_WIRE_CACHE_SIZE:
+                _INVOKE_WIRE_CACHE[key] = wire
+        self._want_image = not resultonly
+        self._write_command(wire)
+        return self._wait_response_and_event(CMD_AT_INVOKE, timeout)
 
     def sample_image(self, times: int = 1, timeout: float = 0.1) -> int:
         """Capture an image from the camera without running inference.
@@ -607,10 +945,9 @@ class ATDevice:  # noqa: PLR0904
             ...     with open('capture.jpg', 'wb') as f:
             ...         f.write(ai.image.data)
         """
+        self._want_image = True
         self._send_command(f"{CMD_AT_SAMPLE}={times}")
-        if (err := self._wait(_CMD_TYPE_RESPONSE, CMD_AT_SAMPLE, 0.05)) == CMD_OK:
-            return self._wait(_CMD_TYPE_EVENT, CMD_AT_SAMPLE, timeout)
-        return err
+        return self._wait_response_and_event(CMD_AT_SAMPLE, timeout)
 
     def id(self, cache: bool = True) -> str | None:
         """Get the device ID.